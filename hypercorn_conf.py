@@ -0,0 +1,23 @@
+"""Hypercorn config for multi-worker production serving.
+
+Run with:
+
+    hypercorn -c file:hypercorn_conf.py event_monitor:app
+
+One worker process per core scales the CPU-bound JSON path linearly,
+with each worker's event loop multiplexing its own connections.
+
+Note: dedupe state (seen_incident_keys / seen_body_digests) is
+per-worker, so a retried webhook landing on a different worker can be
+printed twice. Either run single-worker, use sticky routing by
+incident id, or point REDIS_URL at a shared Redis for cross-worker
+dedupe.
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = multiprocessing.cpu_count()
+worker_class = "asyncio"
+backlog = 1000
@@ -0,0 +1,5 @@
+"""Event-based webhook monitor for OpenAI status incidents."""
+
+from monitor.app import app
+
+__all__ = ["app"]
@@ -0,0 +1,82 @@
+"""CLI entry point: python -m monitor (or python event_monitor.py)."""
+
+import argparse
+import asyncio
+import logging
+
+from monitor.app import app
+
+
+def main():
+    """Run the webhook server."""
+    parser = argparse.ArgumentParser(
+        description="Event-Based Status Monitor (Webhooks)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Event-Based Architecture (Scales to 100+ Providers):
+────────────────────────────────────────────────────
+
+  - Each provider sends webhooks to this single endpoint
+  - Server handles them instantly as they arrive
+    - No polling overhead
+  - Truly scalable architecture
+
+Test Locally:
+    curl -X POST http://localhost:5000/webhook/statuspage \
+             -H "Content-Type: application/json" \
+             -d '{"incident":{"id":"local_test","name":"Chat Completions API - Elevated Error Rates","status":"investigating","updated_at":"2025-11-03T14:32:00Z","components":[{"name":"Chat Completions"}],"incident_updates":[{"body":"Degraded performance due to upstream issue"}]},"page":{"name":"OpenAI API"}}'
+
+Examples:
+  python event_monitor.py                    # Start on port 5000
+  python event_monitor.py --port 8000        # Custom port
+"""
+        )
+
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=5000,
+        help="Port to run webhook server on (default: 5000)"
+    )
+
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="0.0.0.0",
+        help="Host to bind to (default: 0.0.0.0 for all interfaces)"
+    )
+
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Enable debug mode"
+    )
+
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="Use Quart's dev server (reloader/debugger) instead of Hypercorn"
+    )
+
+    args = parser.parse_args()
+
+
+    # Suppress request access logs so only formatted output is printed
+    logging.getLogger("hypercorn.access").setLevel(logging.ERROR)
+
+    if args.dev or args.debug:
+        # Quart dev server (reloader/debugger support)
+        app.run(host=args.host, port=args.port, debug=args.debug)
+    else:
+        # Hypercorn ASGI server: one event loop multiplexes hundreds of
+        # concurrent webhook POSTs without thread-per-request overhead
+        from hypercorn.asyncio import serve
+        from hypercorn.config import Config
+
+        config = Config()
+        config.bind = [f"{args.host}:{args.port}"]
+        asyncio.run(serve(app, config))
+
+
+if __name__ == "__main__":
+    main()
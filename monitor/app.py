@@ -0,0 +1,211 @@
+"""Quart routes and the background drain for the webhook server."""
+
+from quart import Quart, request
+from werkzeug.exceptions import HTTPException
+from cachetools import LRUCache
+from datetime import datetime
+import asyncio
+import hashlib
+import json
+import sys
+import time
+from typing import Dict, Optional
+
+import orjson
+
+from monitor.core import (
+    Incident,
+    format_output,
+    is_new_incident,
+    parse_webhook_payload,
+    recent_incidents,
+    seen_incident_keys,
+)
+
+app = Quart(__name__)
+
+# Real Statuspage payloads are a few KB; anything bigger is buggy or
+# hostile, and gets a 413 before any parsing happens.
+app.config["MAX_CONTENT_LENGTH"] = 64 * 1024
+
+# Digests of raw request bodies already processed. Statuspage retries
+# resend byte-identical bodies, so a hit here skips JSON parsing entirely.
+seen_body_digests: "LRUCache[bytes, bool]" = LRUCache(maxsize=50_000)
+
+# Serialized GET /incidents response, rebuilt when a new incident lands
+# or TTL expiry changes the live count, rather than on every poll.
+_incidents_cache: Optional[bytes] = None
+_incidents_cache_count = -1
+
+# New incidents are handed off here so the webhook can ACK immediately;
+# a background task does the storage and stdout work.
+incident_queue: "asyncio.Queue[Incident]" = asyncio.Queue(maxsize=10_000)
+
+# Burst batching: the drain flushes once per FLUSH_BATCH incidents or
+# FLUSH_INTERVAL seconds, whichever comes first, amortizing the store
+# update, cache invalidation, and stdout write over the batch.
+FLUSH_BATCH = 32
+FLUSH_INTERVAL = 0.05
+
+# stdout is flushed when the queue drains or at most every 100 ms, so a
+# storm of batches shares flushes instead of syncing the pipe per batch.
+STDOUT_FLUSH_INTERVAL = 0.1
+_last_stdout_flush = 0.0
+
+
+def json_response(obj: Dict, status: int = 200):
+    """Build a JSON response via orjson's C serializer (skips jsonify)."""
+    return app.response_class(
+        orjson.dumps(obj), status=status, content_type="application/json"
+    )
+
+
+def _flush_batch(batch) -> None:
+    """Store a batch of incidents and emit their output in one write."""
+    global _incidents_cache, _last_stdout_flush
+    for incident in batch:
+        # Stored whole in response shape so GET /incidents never re-merges
+        recent_incidents[incident.id] = incident
+    _incidents_cache = None
+    sys.stdout.write("\n".join(format_output(i) for i in batch) + "\n")
+
+    # Let consecutive batches share a flush; always flush once the queue
+    # is drained so output never sits buffered while the server is idle
+    now = time.monotonic()
+    if incident_queue.empty() or now - _last_stdout_flush >= STDOUT_FLUSH_INTERVAL:
+        sys.stdout.flush()
+        _last_stdout_flush = now
+
+
+async def _drain_incidents() -> None:
+    """Consume queued incidents, flushing them in micro-batches.
+
+    Statuspage fans updates out in bursts; waiting up to FLUSH_INTERVAL
+    for stragglers turns a burst into one flush instead of N.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await incident_queue.get()]
+        deadline = loop.time() + FLUSH_INTERVAL
+        while len(batch) < FLUSH_BATCH:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(
+                    await asyncio.wait_for(incident_queue.get(), remaining)
+                )
+            except asyncio.TimeoutError:
+                break
+        _flush_batch(batch)
+
+
+@app.before_serving
+async def _start_drain() -> None:
+    app.add_background_task(_drain_incidents)
+
+
+@app.route("/webhook/statuspage", methods=["POST"])
+async def handle_statuspage_webhook():
+    """Handle Statuspage incident webhooks."""
+    if request.mimetype != "application/json":
+        return json_response({"error": "bad content-type"}, 415)
+
+    try:
+        # orjson's C decoder is several times faster than stdlib json,
+        # and JSON decode dominates per-request CPU here
+        body = await request.get_data()
+
+        # Byte-identical retry? Answer before paying for a JSON parse.
+        # The digest is only recorded once the update is safely enqueued:
+        # Statuspage retries failed deliveries with the identical body,
+        # and recording earlier would answer those retries "duplicate".
+        body_digest = hashlib.blake2b(body, digest_size=16).digest()
+        if body_digest in seen_body_digests:
+            return json_response({
+                "status": "duplicate",
+                "message": "Already processed this update"
+            })
+
+        try:
+            payload = orjson.loads(body or b"{}")
+        except orjson.JSONDecodeError:
+            payload = json.loads(body or b"{}")
+
+        if not payload:
+            return json_response({"error": "No payload"}, 400)
+
+        # Parse the webhook data (one timestamp per request)
+        now_iso = datetime.now().isoformat()
+        incident = parse_webhook_payload(payload, now_iso)
+
+        # Event-based deduplication: Only process NEW updates
+        if not await is_new_incident(incident):
+            return json_response({
+                "status": "duplicate",
+                "message": "Already processed this update"
+            })
+
+        # Hand off storage and printing so the webhook ACKs immediately;
+        # if the queue is full, drop the oldest entry rather than block
+        incident.received_at = now_iso
+        try:
+            incident_queue.put_nowait(incident)
+        except asyncio.QueueFull:
+            incident_queue.get_nowait()
+            incident_queue.put_nowait(incident)
+
+        seen_body_digests[body_digest] = True
+
+        return json_response({
+            "status": "success",
+            "incident_id": incident.id,
+            "message": "Incident processed"
+        })
+
+    except HTTPException:
+        # Let e.g. the 413 from MAX_CONTENT_LENGTH reach the client with
+        # its real status instead of collapsing into a 500
+        raise
+    except Exception as e:
+        return json_response({"error": str(e)}, 500)
+
+
+@app.route("/health", methods=["GET"])
+async def health_check():
+    """Health check endpoint."""
+    return json_response({
+        "status": "running",
+        "mode": "event-based (webhooks)",
+        "incidents_tracked": len(recent_incidents),
+        "total_updates": len(seen_incident_keys),
+        "timestamp": datetime.now().isoformat()
+    })
+
+
+@app.route("/incidents", methods=["GET"])
+async def list_incidents():
+    """List recently received incidents."""
+    global _incidents_cache, _incidents_cache_count
+    # len() on a TTLCache excludes expired entries, so a count mismatch
+    # catches quiet periods where incidents aged out with no new insert
+    count = len(recent_incidents)
+    if _incidents_cache is None or count != _incidents_cache_count:
+        _incidents_cache = orjson.dumps({
+            "count": count,
+            "incidents": list(recent_incidents.values())
+        })
+        _incidents_cache_count = count
+    return app.response_class(_incidents_cache, content_type="application/json")
+
+
+@app.route("/", methods=["GET"])
+async def index():
+    """Root endpoint for basic service info."""
+    return json_response({
+        "service": "OpenAI Status Monitor",
+        "mode": "event-based (webhooks)",
+        "webhook": "/webhook/statuspage",
+        "health": "/health",
+        "incidents": "/incidents"
+    })
@@ -0,0 +1,155 @@
+"""Payload parsing, output formatting, and incident deduplication."""
+
+from cachetools import LRUCache, TTLCache
+from dataclasses import dataclass
+from datetime import datetime
+import hashlib
+import os
+from typing import Callable, Dict, Optional, Tuple
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis is only needed when REDIS_URL is set
+    aioredis = None
+
+# A Statuspage update key older than a day can never legitimately
+# re-arrive, so entries expire after 24h as well as at the size cap.
+DEDUPE_TTL = 86_400
+MAX_SEEN = 200_000
+MAX_RECENT = 1_000
+
+# Shared dedupe store: with REDIS_URL set, SET NX EX makes dedupe atomic
+# across workers and instances; otherwise the local cache below is used.
+_redis = (
+    aioredis.from_url(os.environ["REDIS_URL"])
+    if aioredis is not None and os.environ.get("REDIS_URL")
+    else None
+)
+
+@dataclass(slots=True)
+class Incident:
+    """A parsed Statuspage incident update.
+
+    Slots halve the per-object overhead of the old ~9-key dicts cached
+    in recent_incidents and make field access a fixed-offset load.
+    orjson serializes dataclasses natively, so GET /incidents is
+    unaffected. received_at is stamped by the webhook handler just
+    before the incident is enqueued for the drain.
+    """
+
+    id: str
+    name: str
+    status: str
+    created_at: str
+    updated_at: str
+    components: Tuple[str, ...]
+    service_name: str
+    latest_message: str
+    provider: str
+    received_at: str = ""
+
+
+# Track seen incidents to avoid duplicates (event-based deduplication).
+# TTLCache expires lazily on access, so no background sweeper is needed.
+seen_incident_keys: "TTLCache[bytes, bool]" = TTLCache(maxsize=MAX_SEEN, ttl=DEDUPE_TTL)
+recent_incidents: "TTLCache[str, Incident]" = TTLCache(maxsize=MAX_RECENT, ttl=DEDUPE_TTL)
+
+
+def create_incident_key(incident_id: str, updated_at: str) -> bytes:
+    """Create a unique incident key for dedupe.
+
+    A fixed 16-byte digest instead of the raw f-string: an ISO-timestamped
+    str key costs ~120 bytes resident, the digest ~64, and bytes hash
+    faster than variable-length strings.
+    """
+    return hashlib.blake2b(
+        f"{incident_id}\x00{updated_at}".encode(), digest_size=16
+    ).digest()
+
+
+def _extract_service_name(incident_name: str) -> str:
+    """Derive a service name from an incident title like "Service - Issue"."""
+    if " - " in incident_name:
+        return incident_name.split(" - ")[0].strip()
+    return incident_name
+
+
+def parse_webhook_payload(payload: Dict, now_iso: Optional[str] = None) -> Incident:
+    """Parse an incoming Statuspage webhook payload into an Incident.
+
+    `now_iso` lets the caller supply one per-request timestamp instead of
+    each fallback re-running datetime.now(). The service name is resolved
+    here once so format_output and serialization don't re-derive it.
+    """
+    incident = payload.get("incident", {})
+    page_name = payload.get("page", {}).get("name", "OpenAI API")
+    name = incident.get("name", "Unknown Incident")
+    components = tuple(c.get("name", "Unknown") for c in incident.get("components", []))
+    service_name = ", ".join(components) if components else _extract_service_name(name)
+
+    # No [{}] sentinel: the old default allocated a throwaway list+dict
+    # per webhook just to survive the [0] index
+    updates = incident.get("incident_updates") or ()
+    latest_message = (updates[0].get("body") if updates else "") or name
+
+    return Incident(
+        id=incident.get("id", "unknown"),
+        name=name,
+        status=incident.get("status", "unknown"),
+        created_at=incident.get("created_at", ""),
+        updated_at=incident.get("updated_at") or now_iso or datetime.now().isoformat(),
+        components=components,
+        service_name=service_name,
+        latest_message=latest_message,
+        provider=page_name
+    )
+
+
+# Formatter closures keyed by provider name. Most traffic repeats a
+# handful of providers, so the provider prefix is baked into a closure
+# once and steady-state formatting fills only the dynamic fields.
+_FMT_CACHE: "LRUCache[str, Callable[[Incident], str]]" = LRUCache(maxsize=1_000)
+
+
+def _compile_formatter(provider: str) -> Callable[[Incident], str]:
+    """Build a formatter with the provider prefix baked in."""
+    prefix = f"Product: {provider} - "
+
+    def _fmt(incident: Incident) -> str:
+        # ISO-8601 puts 'T' at a fixed index, so splice around it rather
+        # than scanning with str.replace
+        u = incident.updated_at
+        return (
+            f"[{u[:10]} {u[11:19]}] {prefix}{incident.service_name}\n"
+            f"Status: {incident.latest_message or 'Status update'}"
+        )
+
+    return _fmt
+
+
+def format_output(incident: Incident) -> str:
+    """Format incident output per assignment specification."""
+    provider = incident.provider
+    fmt = _FMT_CACHE.get(provider)
+    if fmt is None:
+        fmt = _FMT_CACHE[provider] = _compile_formatter(provider)
+    return fmt(incident)
+
+
+async def is_new_incident(incident: Incident) -> bool:
+    """Return True only for new or updated incidents."""
+    incident_key = create_incident_key(incident.id, incident.updated_at)
+
+    if _redis is not None:
+        # SET NX is atomic, so exactly one worker wins per update;
+        # EX gives the same 24h eviction the local cache has
+        return bool(
+            await _redis.set(b"inc:" + incident_key, 1, nx=True, ex=DEDUPE_TTL)
+        )
+
+    if incident_key in seen_incident_keys:
+        return False  # Already processed this update
+
+    # New update - remember it; the cache evicts by age and size itself
+    seen_incident_keys[incident_key] = True
+    return True